@@ -32,6 +32,7 @@ cdef class BloomFilter:
 
     cpdef void add(self, long item):
         """Add an item to the Bloom filter"""
+        cdef long h1, h2
         h1 = item % self.size
         # Apply the golden ratio to the item and use modulo to wrap within the size of the bit array
         h2 = <long>(item * 1.618033988749895) % self.size
@@ -41,6 +42,7 @@ cdef class BloomFilter:
 
     cpdef int possibly_contains(self, long item):
         """Check if the item might be in the set"""
+        cdef long h1, h2
         h1 = item % self.size
         # Apply the golden ratio to the item and use modulo to wrap within the size of the bit array
         h2 = <long>(item * 1.618033988749895) % self.size
@@ -62,6 +64,7 @@ cdef class BloomFilter:
 def create_bloom_filter(int size, items):
     """Create and populate a Bloom filter"""
     cdef BloomFilter bf = BloomFilter(size)
+    cdef long item
     for item in items:
         bf.add(item)
     return bf
@@ -20,7 +20,8 @@
 # limitations under the License.
 
 from cpython.bytes cimport PyBytes_AsString, PyBytes_GET_SIZE
-from cpython.object cimport PyObject_Str
+from cpython.object cimport PyObject_GetItem, PyObject_Str
+from cpython.tuple cimport PyTuple_Check, PyTuple_GET_ITEM, PyTuple_GET_SIZE
 from cython cimport int
 from datetime import datetime
 from ormsgpack import unpackb
@@ -88,26 +89,41 @@ cpdef tuple extract_dict_columns(dict data, tuple fields):
 cpdef list collect_cython(list rows, cnp.ndarray[cnp.int32_t, ndim=1] columns, int limit=-1):
     """
     Collects columns from a list of tuples (rows).
+
+    The rows are walked once, each row fetched a single time and its values
+    scattered into the column lists; tuple-backed rows (including Row) are read
+    directly without going through the generic item protocol.
     """
     cdef int32_t i, j, col_idx
     cdef int32_t num_rows = len(rows)
     cdef int32_t num_cols = columns.shape[0]
-    cdef list row
+    cdef int32_t[::1] column_indices = columns
+    cdef int32_t min_col = 0
+    cdef int32_t max_col = -1
+    cdef object row
 
     if limit >= 0 and limit < num_rows:
         num_rows = limit
 
-    # Initialize result memory view with pre-allocated numpy arrays for each column
-    cdef list result = [list([None] * num_rows) for _ in range(num_cols)]
-
-    # Populate each column one at a time
     for j in range(num_cols):
-        col_idx = columns[j]
-        row = result[j]
-        for i in range(num_rows):
-            row[i] = rows[i][col_idx]
-    
-    # Convert each column back to a list and return the list of lists
+        col_idx = column_indices[j]
+        if col_idx < min_col:
+            min_col = col_idx
+        if col_idx > max_col:
+            max_col = col_idx
+
+    # Pre-allocate a list for each of the columns
+    cdef list result = [[None] * num_rows for _ in range(num_cols)]
+
+    for i in range(num_rows):
+        row = rows[i]
+        if min_col >= 0 and PyTuple_Check(row) and PyTuple_GET_SIZE(row) > max_col:
+            for j in range(num_cols):
+                (<list>result[j])[i] = <object>PyTuple_GET_ITEM(row, column_indices[j])
+        else:
+            for j in range(num_cols):
+                (<list>result[j])[i] = PyObject_GetItem(row, column_indices[j])
+
     return result
 
 
@@ -132,5 +148,7 @@ def process_table(table, row_factory, int max_chunksize):
 
     for batch in batches:
         df_array = batch.to_pandas().replace({np.nan: None}).to_numpy()
-        rows.extend(row_factory(i) for i in df_array)
+        # the tuples_only row factories bind tuple.__new__, so map drives the
+        # construction directly without a generator frame per row
+        rows.extend(map(row_factory, df_array))
     return rows
@@ -34,7 +34,7 @@ class _RowsIterator:
     def __init__(
         self, tables: typing.Iterable, row_factory: typing.Callable, batch_size: int, max_size: int
     ):
-        self.tables = itertools.chain(tables)
+        self.tables = iter(tables)
         self.row_factory = row_factory
         self.batch_size = batch_size
         self.max_size = max_size
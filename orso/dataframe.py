@@ -10,7 +10,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import operator
 import typing
+from itertools import islice
 from typing import Generator
 from typing import Iterable
 from typing import List
@@ -31,7 +33,17 @@ class DataFrame:
     Orso DataFrames are a lightweight container for tabular data.
     """
 
-    __slots__ = ("_schema", "_rows", "_cursor", "_row_factory", "arraysize", "_nbytes")
+    __slots__ = (
+        "_schema",
+        "_rows",
+        "_cursor",
+        "_row_factory",
+        "arraysize",
+        "_nbytes",
+        "_materialized",
+        "_rowcount",
+        "_columncount",
+    )
 
     def __init__(
         self,
@@ -71,30 +83,45 @@ class DataFrame:
 
             # make the list of dicts iterable
             dicts = iter(dictionaries)
-            # extract the first of the list, and get the types from it
-            first_dict = next(dicts)
+            # extract the first of the list, and get the types from it, the first entry
+            # is put back on the front of the iterator rather than tee-ing the iterator
+            first_dict = next(dicts, None)
+            if first_dict is None:
+                first_dict = {}
+            else:
+                dicts = chain([first_dict], dicts)
 
             # if we have an explicit schema, use that, otherwise guess from the first entry
             self._schema = [str(k) for k in first_dict]
             self._row_factory = Row.create_class(self._schema)
             keys = list(first_dict.keys())
 
-            # create a list of tuples
-            self._rows = [
-                self._row_factory([row.get(k, None) for k in keys])
-                for row in chain([first_dict], dicts)
-            ]
+            # create a list of tuples, when the keys are all strings the Row factory
+            # can extract the values from plain dicts itself (the compiled extraction
+            # only accepts exact dicts), any other mapping is read by key
+            row_factory = self._row_factory
+            if type(first_dict) is dict and all(isinstance(k, str) for k in keys):
+                self._rows = [
+                    (
+                        row_factory(row)
+                        if type(row) is dict
+                        else row_factory([row.get(k, None) for k in keys])
+                    )
+                    for row in dicts
+                ]
+            else:
+                self._rows = [row_factory([row.get(k, None) for k in keys]) for row in dicts]
         else:
             self._schema = schema  # type:ignore
             self._rows = rows or []  # type:ignore
             self._row_factory = Row.create_class(self._schema)
             self._nbytes = 0
+        self._materialized = isinstance(self._rows, list)
+        self._rowcount = None
+        self._columncount = None
         self.arraysize = 100
         self._cursor = iter(self._rows or [])
 
-    def __new__(cls, *args, **kwargs):
-        return super().__new__(cls)
-
     def group_by(self, columns: List[str]) -> GroupBy:
         return GroupBy(self, columns)
 
@@ -137,6 +164,8 @@ class DataFrame:
             self._schema.validate(entry)
         new_row = self._row_factory(entry)
         self._rows.append(new_row)
+        if self._rowcount is not None:
+            self._rowcount += 1
         self._nbytes += new_row.nbytes()
         self._cursor = None
 
@@ -159,7 +188,7 @@ class DataFrame:
         Returns:
             DataFrame
         """
-        return DataFrame(rows=[r for r in self._rows if predicate(r)], schema=self._schema)
+        return DataFrame(rows=list(filter(predicate, self._rows)), schema=self._schema)
 
     def select(self, attributes) -> "DataFrame":
         """
@@ -173,26 +202,34 @@ class DataFrame:
             if attribute in attributes:
                 attribute_indices.append(index)
 
-        def _inner_projection():
-            for tup in self._rows:
-                yield tuple([tup[indice] for indice in attribute_indices])
+        if tuple(attributes) == self.column_names:
+            # projecting every column in order is an identity, copy the list (if we have
+            # one) so appends to either DataFrame don't affect the other
+            rows = self._rows[:] if self._materialized else self._rows
+            return DataFrame(rows=rows, schema=self._schema)
+
+        if len(attribute_indices) == 1:
+            index = attribute_indices[0]
+            projection = ((row[index],) for row in self._rows)
+        elif attribute_indices:
+            projection = map(operator.itemgetter(*attribute_indices), self._rows)
+        else:
+            projection = (() for row in self._rows)
 
-        return DataFrame(rows=_inner_projection(), schema=new_header)
+        return DataFrame(rows=projection, schema=new_header)
 
     def materialize(self):
         """
         Convert a Lazy DataFrame to an Eager DataFrame
         """
-        if not isinstance(self._rows, list):
+        if not self._materialized:
             self._rows = list(self._rows or [])
+            self._materialized = True
 
     def distinct(self) -> "DataFrame":
-        seen = set()
-        unique_rows = [
-            x
-            for x in self._rows
-            if hash(x) not in seen and not seen.add(hash(x))  # type:ignore
-        ]
+        # dict keys keep insertion order, so this keeps the first of each row and
+        # only hashes each row once
+        unique_rows = list(dict.fromkeys(self._rows))
         return DataFrame(rows=unique_rows, schema=self._schema)
 
     def collect(
@@ -281,14 +318,9 @@ class DataFrame:
         if self._cursor is None:
             raise Exception("Cannot use fetchmany and append on the same DataFrame")
         fetch_size = self.arraysize if size is None else size
-        entries = []
-        for i in range(fetch_size):
-            try:
-                entry = next(self._cursor)
-                entries.append(entry)
-            except StopIteration:
-                break
-        return entries
+        # islice pulls exactly fetch_size rows from the cursor, so lazy frames are not
+        # materialized to serve a fetch
+        return list(islice(self._cursor, fetch_size))
 
     def fetchall(self) -> List[Row]:
         if self._cursor is None:
@@ -399,11 +431,13 @@ class DataFrame:
         return tuple(str(col.name) for col in self._schema.columns)
 
     @property
-    @single_item_cache
     def columncount(self) -> int:
-        if isinstance(self._schema, (tuple, list)):
-            return len(self._schema)
-        return len(self._schema.columns)
+        if self._columncount is None:
+            if isinstance(self._schema, (tuple, list)):
+                self._columncount = len(self._schema)
+            else:
+                self._columncount = len(self._schema.columns)
+        return self._columncount
 
     @property
     def shape(self) -> typing.Tuple[int, int]:
@@ -411,8 +445,10 @@ class DataFrame:
 
     @property
     def rowcount(self) -> int:
-        self.materialize()
-        return len(self._rows)
+        if self._rowcount is None:
+            self.materialize()
+            self._rowcount = len(self._rows)
+        return self._rowcount
 
     @property
     def schema(self) -> RelationSchema:
@@ -431,8 +467,7 @@ class DataFrame:
         return iter(self._rows)
 
     def __len__(self) -> int:
-        self.materialize()
-        return len(self._rows)
+        return self.rowcount
 
     def __repr__(self) -> str:
         """
@@ -12,11 +12,27 @@
 
 import datetime
 import decimal
+import re
+import shutil
+from bisect import bisect_left
 from collections import deque
+from functools import lru_cache
+from io import StringIO
+from itertools import accumulate
+from itertools import compress
+from itertools import count
 from itertools import islice
+from math import isnan
+from types import SimpleNamespace
 from typing import Union
+from unicodedata import east_asian_width
+
+import numpy
 
 from orso.compute.compiled import calculate_data_width
+from orso.dataframe import DataFrame
+from orso.schema import RelationSchema
+from orso.types import OrsoTypes
 
 # Background		#282a36	40 42 54	231° 15% 18%
 # Current Line		#44475a	68 71 90	232° 14% 31%
@@ -67,17 +83,48 @@ COLORS = {
 }
 
 
+# a single pattern matching every color marker, so a record is scanned once rather
+# than once per color
+COLOR_PATTERN = re.compile("|".join(re.escape(k) for k in COLORS))
+
+
+def _color_code(match):
+    return COLORS[match.group(0)]
+
+
+# translate replaces every character in one pass, so unlike chained replace calls
+# the "&" doesn't need escaping first to avoid escaping the other escapes
+HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", '"': "&quot;", "'": "&#39;", "<": "&lt;", ">": "&gt;", "$": "&#x24;"}
+)
+
+
 def colorizer(record, can_colorize=True):
     record = str(record)
     record = record.replace(r"\u0001", "\x01")
+    # most records have no markers, these don't need to go through the regex
+    if "\x01" not in record:
+        return record
     if can_colorize:
-        for k, v in COLORS.items():
-            record = record.replace(k, v)
-    else:
-        for k, v in COLORS.items():  # pragma: no cover
-            record = record.replace(k, "")
+        return COLOR_PATTERN.sub(_color_code, record)
+    return COLOR_PATTERN.sub("", record)  # pragma: no cover
 
-    return record
+
+class _CharacterWidths(dict):
+    """
+    The number of columns a character takes up when displayed, each character is
+    classified once and then read back with a plain dictionary lookup as the same
+    characters are measured over and over when rendering tables.
+    """
+
+    def __missing__(self, symbol: str) -> int:
+        # only fullwidth and wide characters take two columns, neutral characters
+        # (for example Hebrew and Devanagari) are displayed one column wide
+        width = self[symbol] = 2 if east_asian_width(symbol) in ("F", "W") else 1
+        return width
+
+
+character_width = _CharacterWidths().__getitem__
 
 
 def html_table(dictset, limit: int = 5):  # pragma: no cover
@@ -102,35 +149,301 @@ def html_table(dictset, limit: int = 5):  # pragma: no cover
             return sanitize("{ " + ", ".join([f'"{k}": {v}' for k, v in htmlstring.items()]) + " }")
         if not isinstance(htmlstring, str):
             return str(htmlstring)
-        escapes = {'"': "&quot;", "'": "&#39;", "<": "&lt;", ">": "&gt;", "$": "&#x24;"}
-        # This is done first to prevent escaping other escapes.
-        htmlstring = htmlstring.replace("&", "&amp;")
-        for seq, esc in escapes.items():
-            htmlstring = htmlstring.replace(seq, esc)
-        return htmlstring
-
-    def _to_html_table(data, columns):
-        yield '<table class="table table-sm">'
+        return htmlstring.translate(HTML_ESCAPE_TABLE)
+
+    def _to_html_table(buffer, data, columns):
+        write = buffer.write
+        cell = "<td title='{0}' style='max-width:320px;overflow:hidden;text-overflow:ellipsis;white-space:nowrap;'>{0}<td>\n".format
+        write('<table class="table table-sm">')
         for counter, record in enumerate(data):
             if counter == 0:
-                yield '<thead class="thead-light"><tr>'
-                yield "<td></td>"
+                write('<thead class="thead-light"><tr>')
+                write("<td></td>")
                 for column in columns:
-                    yield f"<th>{sanitize(column)}<th>\n"
-                yield "</tr></thead><tbody>"
+                    write(f"<th>{sanitize(column)}<th>\n")
+                write("</tr></thead><tbody>")
+
+            cells = "".join([cell(sanitize(record[i])) for i in range(len(columns))])
+            write(f"<tr><td><bold>{counter}</bold></td>{cells}</tr>")
+
+        write("</tbody></table>")
+
+    buffer = StringIO()
+    _to_html_table(buffer, dictset.head(limit), dictset.column_names)
+    buffer.write(f"\n<p>{dictset.rowcount} rows x {dictset.columncount} columns</p>")  # type:ignore
+    return buffer.getvalue()
+
+
+def numpy_type_mapper(value):
+    if isinstance(value, numpy.ndarray):
+        return value.tolist()
+    if isinstance(value, (numpy.timedelta64,)):
+        seconds = value / numpy.timedelta64(1000000000, "ns")
+        return SimpleNamespace(
+            months=0, days=int(seconds // 86400), nanoseconds=(seconds % 86400) * 1e9
+        )
+    if numpy.issubdtype(value.dtype, numpy.integer):
+        return int(value)
+    if numpy.issubdtype(value.dtype, numpy.floating):
+        return float(value)
+    if numpy.issubdtype(value.dtype, numpy.bool_):
+        return bool(value)
+    if numpy.issubdtype(value.dtype, numpy.ndarray):
+        return list(value)
+
+    return str(value)
+
+
+def trunc_printable(value, width, full_line: bool = True):
+    # printable ASCII has no control or color markers and every character is one
+    # column wide, so the display width is just the length of the string
+    if value.isascii() and value.isprintable():
+        length = len(value)
+        if length and length >= width:
+            return value[: max(width, 1)] + "\001OFFm"
+        if full_line:
+            return value + "\001OFFm" + " " * (width - length)
+        return value + "\001OFFm"
+
+    # without markers or line breaks every character is visible, so the running width
+    # can be built in C and the cut point found by bisecting it, then sliced once
+    if not ("\001" in value or "\033" in value or "\n" in value or "\r" in value):
+        offsets = list(accumulate(map(character_width, value)))
+        cut = bisect_left(offsets, width)
+        if cut < len(offsets):
+            return value[: cut + 1] + "\001OFFm"
+        if full_line:
+            return value + "\001OFFm" + " " * (width - (offsets[-1] if offsets else 0))
+        return value + "\001OFFm"
+
+    offset = 0
+    emit = []
+    append = emit.append
+    ignoring = False
+
+    for char in value:
+        if char == "\n":
+            append("\001CRLFm↵\001VARCHARm")
+            offset += 1
+            continue
+        if char == "\r":
+            continue
+        append(char)
+        if char in ("\033", "\001"):
+            ignoring = True
+        if not ignoring:
+            offset += character_width(char)
+        if ignoring and char == "m":
+            ignoring = False
+        if not ignoring and offset >= width:
+            return "".join(emit) + "\001OFFm"
+    line = "".join(emit) + "\001OFFm"
+    if full_line:
+        return line + " " * (width - offset)
+    return line
+
+
+def _format_null(value, width):
+    return "\001NULLm" + "null".rjust(width)[:width] + "\001OFFm"
+
+
+def _format_boolean(value, width):
+    return "\001CONSTm" + str(value).rjust(width)[:width] + "\001OFFm"
+
+
+def _format_integer(value, width):
+    return "\001INTEGERm" + str(value).rjust(width)[:width] + "\001OFFm"
+
+
+def _format_float(value, width):
+    if isnan(value):
+        return _format_null(value, width)
+    return "\001FLOATm" + str(value).rjust(width)[:width] + "\001OFFm"
+
+
+def _format_decimal(value, width):
+    return "\001FLOATm" + str(value).rjust(width)[:width] + "\001OFFm"
+
+
+def _format_varchar(value, width):
+    return "\001VARCHARm" + trunc_printable(str(value).ljust(width), width) + "\001OFFm"
+
 
-            yield "<tr>"
-            yield f"<td><bold>{counter}</bold></td>"
-            for i, column in enumerate(columns):
-                sanitized = sanitize(record[i])
-                yield f"<td title='{sanitized}' style='max-width:320px;overflow:hidden;text-overflow:ellipsis;white-space:nowrap;'>{sanitized}<td>\n"
-            yield "</tr>"
+def _format_timestamp(value, width):
+    value = f"{value.strftime('%Y-%m-%d')} \001TIMEm{value.strftime('%H:%M:%S')}"
+    return "\001DATEm" + trunc_printable(value.rjust(width), width) + "\001OFFm"
 
-        yield "</tbody></table>"
 
-    footer = f"\n<p>{dictset.rowcount} rows x {dictset.columncount} columns</p>"  # type:ignore
+def _format_date(value, width):
+    value = f"{value.strftime('%Y-%m-%d')}"
+    return "\001DATEm" + trunc_printable(value.rjust(width), width) + "\001OFFm"
 
-    return "".join(_to_html_table(dictset.head(limit), dictset.column_names)) + footer
+
+def _format_blob(value, width):
+    return "\001BLOBm" + trunc_printable(value.decode("utf-8").ljust(width), width) + "\001OFFm"
+
+
+def _format_struct(value, width):
+    parts = ["\001PUNCm{"]
+    append = parts.append
+    for k, v in value.items():
+        append(f"'\001KEYm{k}\001PUNCm':'\001VALUEm{v}\001PUNCm'")
+        append("\001PUNCm, ")
+    if len(parts) > 1:
+        parts.pop()
+    append("}\001OFFm")
+    return trunc_printable("".join(parts), width)
+
+
+def _format_interval(value, width):
+    if isinstance(value, datetime.timedelta):
+        days = value.days
+        months = 0
+        seconds = value.microseconds / 1e6 + value.seconds
+    else:
+        days = value.days
+        months = value.months
+        seconds = value.nanoseconds / 1e9
+
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    years, months = divmod(months, 12)
+    parts = []
+    if years:
+        parts.append(f"{int(years)}y")
+    if months:
+        parts.append(f"{int(months)}mo")
+    if days:
+        parts.append(f"{int(days)}d")
+    if hours:
+        parts.append(f"{int(hours)}h")
+    if minutes:
+        parts.append(f"{int(minutes)}m")
+    if seconds:
+        parts.append(f"{seconds:.2f}s")
+    value = f"\001INTERVALm{' '.join(parts)}\001OFFm"
+    return trunc_printable(value, width)
+
+
+def _format_array(value, width):
+    parts = ["\001PUNCm['\001VALUEm"]
+    append = parts.append
+    for item in value:
+        append(str(item))
+        append("\001PUNCm', '\001VALUEm")
+    if len(parts) > 1:
+        parts.pop()
+    append("\001PUNCm']\001OFFm")
+    return trunc_printable("".join(parts), width)
+
+
+def _format_numpy(value, width):
+    return type_formatter(numpy_type_mapper(value), width)
+
+
+# formatters for the exact types we usually see, these avoid walking the chain of
+# isinstance tests in type_formatter for every cell
+TYPE_FORMATTERS = {
+    type(None): _format_null,
+    bool: _format_boolean,
+    int: _format_integer,
+    float: _format_float,
+    decimal.Decimal: _format_decimal,
+    str: _format_varchar,
+    datetime.datetime: _format_timestamp,
+    datetime.date: _format_date,
+    bytes: _format_blob,
+    bytearray: _format_blob,
+    dict: _format_struct,
+    datetime.timedelta: _format_interval,
+    list: _format_array,
+    tuple: _format_array,
+}
+
+
+def type_formatter(value, width, type_=None):
+    formatter = TYPE_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value, width)
+
+    # subclasses and numpy values fall back to the isinstance tests, numpy types are
+    # registered the first time they are seen so later cells skip these tests
+    if isinstance(value, (numpy.generic, numpy.ndarray)):
+        TYPE_FORMATTERS[type(value)] = _format_numpy
+        return _format_numpy(value, width)
+
+    if value is None:
+        return _format_null(value, width)
+    if isinstance(value, bool):
+        # bool is a superclass of int, do before the int test
+        return _format_boolean(value, width)
+    if isinstance(value, int):
+        return _format_integer(value, width)
+    if isinstance(value, float):
+        return _format_float(value, width)
+    if isinstance(value, decimal.Decimal):
+        return _format_decimal(value, width)
+    if isinstance(value, str):
+        return _format_varchar(value, width)
+    if isinstance(value, datetime.datetime):
+        return _format_timestamp(value, width)
+    if isinstance(value, datetime.date):
+        return _format_date(value, width)
+    if isinstance(value, (bytes, bytearray)):
+        return _format_blob(value, width)
+    if isinstance(value, dict):
+        return _format_struct(value, width)
+    if hasattr(value, "days"):
+        # MonthDayNano is a superclass of list, do before list
+        return _format_interval(value, width)
+    if isinstance(value, (list, tuple)):
+        return _format_array(value, width)
+    return str(value).ljust(width)[:width]
+
+
+# the color marker and Python type of the cells in columns with these declared types,
+# the cells are right-aligned so they can be formatted without calling trunc_printable
+FIXED_WIDTH_COLUMNS = {
+    OrsoTypes.BOOLEAN: (bool, "\001CONSTm"),
+    OrsoTypes.INTEGER: (int, "\001INTEGERm"),
+    OrsoTypes.DECIMAL: (decimal.Decimal, "\001FLOATm"),
+}
+
+
+def column_formatter(type_, width):
+    """
+    Build the cell formatter for a column, the color marker and width are bound once
+    for the column; cells which don't match the declared type use type_formatter.
+    """
+    spec = FIXED_WIDTH_COLUMNS.get(type_)
+    if spec is None:
+        return lambda value: type_formatter(value, width)
+
+    python_type, prefix = spec
+
+    def _format(value):
+        if type(value) is python_type:
+            return prefix + str(value).rjust(width)[:width] + "\001OFFm"
+        return type_formatter(value, width)
+
+    return _format
+
+
+@lru_cache(maxsize=128)
+def horizontal_rule(left: str, fill: str, junction: str, right: str, index_width: int, col_width):
+    """
+    Build one of the horizontal borders of an ASCII table, these are cached as the
+    same column widths tend to be rendered over and over.
+    """
+    return (
+        left
+        + (fill * index_width)
+        + junction
+        + fill
+        + (fill + junction + fill).join(fill * cw for cw in col_width)
+        + fill
+        + right
+    )
 
 
 def ascii_table(
@@ -160,23 +473,14 @@ def ascii_table(
     Returns:
         string (ASCII table)
     """
-    from math import isnan
-
-    import numpy
-
-    from orso import DataFrame
-
     lazy_length = 0
     is_lazy = not isinstance(table._rows, list)
 
     # get the width of the display
     if isinstance(display_width, bool):
-        if not display_width:  # pragma: no cover
-            display_width = 5000
-        else:
-            import shutil
-
-            display_width = shutil.get_terminal_size((80, 20))[0]
+        display_width = (
+            shutil.get_terminal_size((80, 20))[0] if display_width else 5000
+        )  # pragma: no cover
     # Extract head data
     if limit > 0 and not top_and_tail:
         if is_lazy:
@@ -188,11 +492,11 @@ def ascii_table(
             t = table.head(size=limit) + table.tail(size=limit)
         elif is_lazy:
             head = list(islice(table._rows, limit))
-            tail_collector = deque(maxlen=limit)
-            for lazy_length, entry in enumerate(table._rows):
-                tail_collector.append(entry)
-            tail = list(tail_collector)
-            lazy_length += len(head) + 1
+            # compress pulls a row before it pulls from the counter, so once the rows
+            # are exhausted the counter's next value is one more than the rows read
+            counter = count(1)
+            tail = list(deque(compress(table._rows, counter), maxlen=limit))
+            lazy_length = len(head) + next(counter) - 1
             t = DataFrame(rows=head + tail, schema=table.schema)
         else:
             t = table
@@ -202,139 +506,13 @@ def ascii_table(
     # width of index column
     index_width = len(str(lazy_length + 1)) + 2 if is_lazy else len(str(len(table))) + 2
 
-    def numpy_type_mapper(value):
-        if isinstance(value, numpy.ndarray):
-            return value.tolist()
-        if isinstance(value, (numpy.timedelta64,)):
-            from types import SimpleNamespace
-
-            seconds = value / numpy.timedelta64(1000000000, "ns")
-            return SimpleNamespace(
-                months=0, days=int(seconds // 86400), nanoseconds=(seconds % 86400) * 1e9
-            )
-        if numpy.issubdtype(value.dtype, numpy.integer):
-            return int(value)
-        if numpy.issubdtype(value.dtype, numpy.floating):
-            return float(value)
-        if numpy.issubdtype(value.dtype, numpy.bool_):
-            return bool(value)
-        if numpy.issubdtype(value.dtype, numpy.ndarray):
-            return list(value)
-
-        return str(value)
-
-    def type_formatter(value, width, type_):
-        if isinstance(value, (numpy.generic, numpy.ndarray)):
-            value = numpy_type_mapper(value)
-
-        if value is None or (isinstance(value, float) and isnan(value)):
-            return "\001NULLm" + "null".rjust(width)[:width] + "\001OFFm"
-        if isinstance(value, bool):
-            # bool is a superclass of int, do before the int test
-            return "\001CONSTm" + str(value).rjust(width)[:width] + "\001OFFm"
-        if isinstance(value, int):
-            return "\001INTEGERm" + str(value).rjust(width)[:width] + "\001OFFm"
-        if isinstance(value, (float, decimal.Decimal)):
-            return "\001FLOATm" + str(value).rjust(width)[:width] + "\001OFFm"
-        if isinstance(value, str):
-            return "\001VARCHARm" + trunc_printable(str(value).ljust(width), width) + "\001OFFm"
-        if isinstance(value, datetime.datetime):
-            value = f"{value.strftime('%Y-%m-%d')} \001TIMEm{value.strftime('%H:%M:%S')}"
-            return "\001DATEm" + trunc_printable(value.rjust(width), width) + "\001OFFm"
-        if isinstance(value, datetime.date):
-            value = f"{value.strftime('%Y-%m-%d')}"
-            return "\001DATEm" + trunc_printable(value.rjust(width), width) + "\001OFFm"
-        if isinstance(value, (bytes, bytearray)):
-            return (
-                "\001BLOBm"
-                + trunc_printable(value.decode("utf-8").ljust(width), width)
-                + "\001OFFm"
-            )
-        if isinstance(value, dict):
-            value = (
-                "\001PUNCm{"
-                + "\001PUNCm, ".join(
-                    f"'\001KEYm{k}\001PUNCm':'\001VALUEm{v}\001PUNCm'" for k, v in value.items()
-                )
-                + "}\001OFFm"
-            )
-            return trunc_printable(value, width)
-        if hasattr(value, "days"):
-            # MonthDayNano is a superclass of list, do before list
-            if isinstance(value, datetime.timedelta):
-                days = value.days
-                months = 0
-                seconds = value.microseconds / 1e6 + value.seconds
-            else:
-                days = value.days
-                months = value.months
-                seconds = value.nanoseconds / 1e9
-
-            hours, seconds = divmod(seconds, 3600)
-            minutes, seconds = divmod(seconds, 60)
-            years, months = divmod(months, 12)
-            parts = []
-            if years:
-                parts.append(f"{int(years)}y")
-            if months:
-                parts.append(f"{int(months)}mo")
-            if days:
-                parts.append(f"{int(days)}d")
-            if hours:
-                parts.append(f"{int(hours)}h")
-            if minutes:
-                parts.append(f"{int(minutes)}m")
-            if seconds:
-                parts.append(f"{seconds:.2f}s")
-            value = f"\001INTERVALm{' '.join(parts)}\001OFFm"
-            return trunc_printable(value, width)
-        if isinstance(value, (list, tuple)):
-            value = (
-                "\001PUNCm['\001VALUEm"
-                + "\001PUNCm', '\001VALUEm".join(map(str, value))
-                + "\001PUNCm']\001OFFm"
-            )
-            return trunc_printable(value, width)
-        return str(value).ljust(width)[:width]
-
-    def character_width(symbol):
-        import unicodedata
-
-        return 2 if unicodedata.east_asian_width(symbol) in ("F", "N", "W") else 1
-
-    def trunc_printable(value, width, full_line: bool = True):
-        offset = 0
-        emit = ""
-        ignoring = False
-
-        for char in value:
-            if char == "\n":
-                emit += "\001CRLFm↵\001VARCHARm"
-                offset += 1
-                continue
-            if char == "\r":
-                continue
-            emit += char
-            if char in ("\033", "\001"):
-                ignoring = True
-            if not ignoring:
-                offset += character_width(char)
-            if ignoring and char == "m":
-                ignoring = False
-            if not ignoring and offset >= width:
-                return emit + "\001OFFm"
-        line = emit + "\001OFFm"
-        if full_line:
-            return line + " " * (width - offset)
-        return line
-
     def _inner():
         # Calculate width
         col_width = list(map(len, t.column_names))
 
-        data_width = [calculate_data_width(t.collect(i)) for i in range(t.columncount)]
-        from orso.schema import RelationSchema
-        from orso.types import OrsoTypes
+        # collect every column in a single pass over the rows
+        columns = t.collect(list(range(t.columncount)))
+        data_width = list(map(calculate_data_width, columns))
 
         if isinstance(t.schema, RelationSchema):
             col_types = [column.type for column in t.schema.columns]
@@ -347,7 +525,8 @@ def ascii_table(
         ]
 
         # Print data
-        yield ("┌" + ("─" * index_width) + "┬─" + "─┬─".join("─" * cw for cw in col_width) + "─┐")
+        col_width = tuple(col_width)
+        yield horizontal_rule("┌", "─", "┬", "┐", index_width, col_width)
         yield (
             "│"
             + (" " * index_width)
@@ -368,21 +547,18 @@ def ascii_table(
                 )
                 + " │"
             )
-        yield ("╞" + ("═" * index_width) + "╪═" + "═╪═".join("═" * cw for cw in col_width) + "═╡")
+        yield horizontal_rule("╞", "═", "╪", "╡", index_width, col_width)
+        formatters = [column_formatter(ct, w) for ct, w in zip(col_types, col_width)]
+        # the index column markers and alignment are the same on every row
+        row_line = f"│\001TYPEm{{:>{index_width - 1}}}\001OFFm │ {{}} │".format
         if is_lazy:
             offset = 1
             for i, row in enumerate(t):
                 if i == limit and lazy_length > (2 * limit):
                     yield "..."
                     offset += lazy_length - 2 * limit
-                formatted = [type_formatter(v, w, t) for v, w, t in zip(row, col_width, col_types)]
-                yield (
-                    "│\001TYPEm"
-                    + str(i + offset).rjust(index_width - 1)
-                    + "\001OFFm │ "
-                    + " │ ".join(formatted)
-                    + " │"
-                )
+                formatted = [formatter(v) for formatter, v in zip(formatters, row)]
+                yield row_line(i + offset, " │ ".join(formatted))
         else:
             for i, row in enumerate(t):
                 if top_and_tail and (table.rowcount > 2 * limit):
@@ -390,19 +566,13 @@ def ascii_table(
                         yield "\001PUNCm...\001OFFm"
                     if i >= limit:
                         i += t.rowcount - (2 * limit)
-                formatted = [type_formatter(v, w, t) for v, w, t in zip(row, col_width, col_types)]
-                yield (
-                    "│\001TYPEm"
-                    + str(i + 1).rjust(index_width - 1)
-                    + "\001OFFm │ "
-                    + " │ ".join(formatted)
-                    + " │"
-                )
-        yield ("└" + ("─" * index_width) + "┴─" + "─┴─".join("─" * cw for cw in col_width) + "─┘")
+                formatted = [formatter(v) for formatter, v in zip(formatters, row)]
+                yield row_line(i + 1, " │ ".join(formatted))
+        yield horizontal_rule("└", "─", "┴", "┘", index_width, col_width)
 
-    return "\n".join(
-        colorizer(trunc_printable(line, display_width, False), colorize) for line in _inner()
-    )
+    # the color markers never span lines, so the whole table is colorized in one pass
+    body = "\n".join([trunc_printable(line, display_width, False) for line in _inner()])
+    return colorizer(body, colorize)
 
 
 def markdown(
@@ -418,10 +588,7 @@ def markdown(
 
     # Calculate width
     col_width = list(map(len, t.column_names))
-    data_width = [
-        max(list(map(len, map(str, [p for p in h if p is not None]))) + [4])
-        for h in (t.collect(i) for i in range(t.columncount))
-    ]
+    data_width = list(map(calculate_data_width, t.collect(list(range(t.columncount)))))
     col_width = [min(max(cw, dw), max_column_width) for cw, dw in zip(col_width, data_width)]
 
     # Print data
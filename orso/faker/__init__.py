@@ -1,8 +1,12 @@
 import random
 
+import numpy
+
 from orso.dataframe import DataFrame
 from orso.faker.decimals import generate_random_decimal
 from orso.faker.names import generate_random_name
+from orso.faker.temporal import DEFAULT_SPAN
+from orso.faker.temporal import START_RANGE
 from orso.faker.temporal import generate_random_datetime
 from orso.schema import ColumnDisposition
 from orso.schema import RelationSchema
@@ -22,9 +26,8 @@ def generate_random_row(schema: RelationSchema) -> tuple:
     Returns:
         tuple: A tuple of random values based on the schema.
     """
-    columns = [schema.column(i) for i in range(schema.num_columns)]
     row = []
-    for column in columns:
+    for column in schema.columns:
         # if the column is nullable, set 1% of the values to null
         if column.nullable and random_int() % 100 == 0:
             row.append(None)
@@ -51,6 +54,51 @@ def generate_random_row(schema: RelationSchema) -> tuple:
     return tuple(row)
 
 
+def generate_random_column(column, size: int, rng: numpy.random.Generator) -> list:
+    """
+    Generates a column of random values for the given column definition, the numeric
+    and temporal values are drawn in bulk by numpy rather than one at a time.
+
+    Parameters:
+        column: FlatColumn
+            The column to generate the values for.
+        size: int
+            The number of values to generate.
+        rng: numpy.random.Generator
+            The random number generator to draw the values from.
+
+    Returns:
+        list: A list of random values of the column's type.
+    """
+    if column.type == OrsoTypes.INTEGER:
+        if column.disposition == ColumnDisposition.AGE:
+            values = rng.integers(0, 100, size, endpoint=True).tolist()
+        else:
+            values = rng.integers(0, 1 << 32, size).tolist()
+    elif column.type == OrsoTypes.VARCHAR:
+        if column.disposition == ColumnDisposition.NAME:
+            values = [generate_random_name() for _ in range(size)]
+        else:
+            values = [random_string(width) for width in rng.integers(8, 24, size).tolist()]
+    elif column.type == OrsoTypes.BOOLEAN:
+        values = rng.integers(0, 2, size).astype(numpy.bool_).tolist()
+    elif column.type == OrsoTypes.DECIMAL:
+        values = [generate_random_decimal(column.precision, column.scale) for _ in range(size)]
+    elif column.type == OrsoTypes.DOUBLE:
+        values = rng.random(size).tolist()
+    elif column.type == OrsoTypes.TIMESTAMP:
+        offsets = rng.integers(0, DEFAULT_SPAN, size, endpoint=True)
+        values = (numpy.datetime64(START_RANGE, "s") + offsets).tolist()
+    else:
+        raise TypeError(f"Orso currently cannot fake {column.type} values.")
+
+    # if the column is nullable, set 1% of the values to null
+    if column.nullable:
+        for index in numpy.flatnonzero(rng.integers(0, 100, size) == 0).tolist():
+            values[index] = None
+    return values
+
+
 def generate_fake_data(schema: RelationSchema, size: int = 100) -> DataFrame:
     """
     Generates a DataFrame of fake data based on the given schema and size.
@@ -64,5 +112,8 @@ def generate_fake_data(schema: RelationSchema, size: int = 100) -> DataFrame:
     Returns:
         DataFrame: A DataFrame containing the generated fake data.
     """
-    rows = [generate_random_row(schema) for i in range(size)]
+    # seed numpy from the random module so random.seed still makes the data repeatable
+    rng = numpy.random.default_rng(random.getrandbits(64))
+    columns = [generate_random_column(column, size, rng) for column in schema.columns]
+    rows = list(zip(*columns)) if columns else [()] * size
     return DataFrame(rows=rows, schema=schema)
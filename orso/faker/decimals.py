@@ -21,11 +21,10 @@ def generate_random_decimal(precision: int, scale: int) -> decimal.Decimal:
 
     int_part_len = precision - scale
 
-    int_part = "".join(str(random.randint(0, 9)) for _ in range(int_part_len))
-    frac_part = "".join(str(random.randint(0, 9)) for _ in range(scale))
-
     # Ensure the integer part is not all zeros.
-    if all(d == "0" for d in int_part):  # pragma: no cover
-        int_part = str(random.randint(1, 9)) + int_part[1:]
+    int_part = random.randrange(1, 10**int_part_len) if int_part_len else random.randint(1, 9)
+    frac_part = random.randrange(10**scale)
 
-    return decimal.Decimal(f"{int_part}.{frac_part}")
+    # build from the digits of the coefficient, this avoids parsing a string
+    digits = tuple(map(int, str(int_part * 10**scale + frac_part)))
+    return decimal.Decimal((0, digits, -scale))
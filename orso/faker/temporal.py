@@ -3,6 +3,7 @@ import random
 
 START_RANGE = datetime.datetime(1960, 1, 1)
 END_RANGE = datetime.datetime(2100, 12, 31)
+DEFAULT_SPAN = int((END_RANGE - START_RANGE).total_seconds())
 
 
 def generate_random_datetime(
@@ -20,6 +21,8 @@ def generate_random_datetime(
     Returns:
         datetime: A random datetime between the start and end.
     """
-    delta = end - start
-    random_seconds = random.randint(0, int(delta.total_seconds()))
-    return start + datetime.timedelta(seconds=random_seconds)
+    if start is START_RANGE and end is END_RANGE:
+        span = DEFAULT_SPAN
+    else:
+        span = int((end - start).total_seconds())
+    return start + datetime.timedelta(seconds=random.randint(0, span))
@@ -12,16 +12,67 @@
 
 import array
 import decimal
-from collections import defaultdict
+import operator
+from collections import deque
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
 from typing import Tuple
-from typing import Union
 
 
 # Aggregation Functions
+# each aggregation is a running state which is started from the first value in the
+# group and updated with each following value, so the values themselves are never
+# held, and a finalizer to turn the state into the result. Where a builtin can do the
+# update it is used, so the step runs in C.
+def first_value(value: Any) -> Any:
+    return value
+
+
+def count_first(value: Any) -> int:
+    return 1
+
+
+def count_step(state: int, value: Any) -> int:
+    return state + 1
+
+
+def avg_first(value: Any) -> Tuple[Any, int]:
+    return (value, 1)
+
+
+def avg_step(state: Tuple[Any, int], value: Any) -> Tuple[Any, int]:
+    return (state[0] + value, state[1] + 1)
+
+
+def avg_final(state: Optional[Tuple[Any, int]]) -> Any:
+    # integers are summed exactly so a single float division is accurate, decimals
+    # stay decimals as dividing a Decimal by an int gives a Decimal
+    if state is None:
+        return None
+    total, count = state
+    return total / count
+
+
+def zero_if_empty(state: Any) -> Any:
+    return 0 if state is None else state
+
+
+# the function to start the state, the step function and the finalizer for each
+# aggregation, the state is None until a value has been seen
+AGGREGATION_STATES = {
+    "MIN": (first_value, min, first_value),
+    "MAX": (first_value, max, first_value),
+    "COUNT": (count_first, count_step, zero_if_empty),
+    "AVG": (avg_first, avg_step, avg_final),
+    "SUM": (first_value, operator.add, zero_if_empty),
+}
+
+
+# Whole-list aggregation functions, aggregate no longer uses these
 def min_agg(values: List[Any]) -> Any:
     return min(values)
 
@@ -63,43 +114,46 @@ class GroupBy:
             self._columns = tuple(columns)
         else:
             self._columns = [columns]
-        self._group_keys = {}
+        self._column_indicies = {name: i for i, name in enumerate(dictset.column_names)}
+        self._group_column_indicies = array.array(
+            "i", (self._column_indicies[target] for target in self._columns)
+        )
+        # each distinct group is given a small integer id, _group_keys holds the
+        # column names and values of each group by its id
+        self._group_ids = {}
+        self._group_keys = []
 
-    def _map(self, collect_columns: Union[str, List[str]]) -> Dict[int, Dict[str, List[Any]]]:
+    def _map(self) -> Iterator[Tuple[int, tuple]]:
         """
-        Maps the dataset into groups based on given columns.
-
-        Parameters:
-            collect_columns: Union[str, List[str]]
-                Columns used for aggregation.
+        Maps the dataset into groups based on the group columns.
 
-        Returns:
-            A dictionary containing groups and aggregated values.
+        Yields:
+            The group id and the record, for every record.
         """
-        collect_columns = (
-            collect_columns if isinstance(collect_columns, list) else [collect_columns]
-        )
         source_columns = self._dictset.column_names
-        collect_column_indicies = [
-            source_columns.index(target) if target in source_columns else -1
-            for target in collect_columns
-        ]
-        group_column_indicies = array.array(
-            "i",
-            (source_columns.index(target) for target in self._columns),
-        )
+        group_column_indicies = self._group_column_indicies
+
+        # the group values are pulled out of each record in C and used as the key
+        # directly, rather than building a tuple in Python and hashing it
+        if group_column_indicies:
+            get_group_key = operator.itemgetter(*group_column_indicies)
+        else:
+            get_group_key = lambda record: ()
 
+        # ids are handed out from zero in the order the groups are first seen
+        group_ids = self._group_ids = {}
+        self._group_keys = []
         for record in self._dictset:
-            # Create a unique hash for each group
-            group_key = hash(tuple(record[col] for col in group_column_indicies))
+            # later lookups by the consumers hash this integer, not the group values
+            group_key = group_ids.get(get_group_key(record))
 
-            if group_key not in self._group_keys:
-                self._group_keys[group_key] = [
-                    (source_columns[column], record[column]) for column in group_column_indicies
-                ]
+            if group_key is None:
+                group_key = group_ids[get_group_key(record)] = len(self._group_keys)
+                self._group_keys.append(
+                    [(source_columns[column], record[column]) for column in group_column_indicies]
+                )
 
-            for i, column in enumerate(collect_column_indicies):
-                yield (group_key, collect_columns[i], "*" if column == -1 else record[column])
+            yield group_key, record
 
     def aggregate(self, aggregations: List[Tuple[str, Callable]]) -> "DataFrame":
         """
@@ -112,32 +166,49 @@ class GroupBy:
         Returns:
             A dictionary containing groups and aggregated values.
         """
-        aggregated_data = {}
-        column_value_map = defaultdict(lambda: defaultdict(list))
-
         if not isinstance(aggregations, list):
             aggregations = [aggregations]
         if not all(isinstance(agg, tuple) for agg in aggregations):  # pragma: no cover
             raise ValueError("`aggregate` expects a list of Tuples")
 
-        # Collecting the values for each group and column
-        for group_key, column, value in self._map([col for _, col in aggregations]):
-            if value is not None:
-                column_value_map[group_key][column].append(value)
-
-        # Applying aggregation functions
-        for group, column_values in column_value_map.items():
-            aggregated_data[group] = {}
-            for func, col in aggregations:
-                aggregated_data[group][f"{func}({col})"] = AGGREGATORS[func](
-                    column_values.get(col, [])
-                )
+        # for each aggregation, how to get its value from a record, and how to start and
+        # step its state; columns not in the dataset, like the * of COUNT(*), collect a
+        # placeholder
+        plan = []
+        for index, (func, column) in enumerate(aggregations):
+            position = self._column_indicies.get(column, -1)
+            extract = (lambda record: "*") if position == -1 else operator.itemgetter(position)
+            plan.append((index, extract, AGGREGATION_STATES[func][0], AGGREGATION_STATES[func][1]))
+        initial_states = [None] * len(aggregations)
+
+        # the running state of each aggregation for each group, indexed by the group's
+        # id, groups stay None until they see a value so empty groups can be left out.
+        # _map hands over whole records so the values are extracted here, rather than
+        # resuming a generator for every value
+        group_states: List[Optional[List[Any]]] = []
+        for group_key, record in self._map():
+            # group ids are handed out in order, so a new group is always the next slot
+            if group_key == len(group_states):
+                group_states.append(None)
+            for index, extract, first, step in plan:
+                value = extract(record)
+                if value is None:
+                    continue
+                states = group_states[group_key]
+                if states is None:
+                    states = group_states[group_key] = initial_states.copy()
+                state = states[index]
+                states[index] = first(value) if state is None else step(state, value)
 
         result_set = []
-        for group, values in aggregated_data.items():
-            results = {f"{func}({col})": values.get(f"{func}({col})") for func, col in aggregations}
-            keys = self._group_keys[group]
-            for key in keys:
+        for group, states in enumerate(group_states):
+            if states is None:
+                continue
+            results = {
+                f"{func}({col})": AGGREGATION_STATES[func][2](state)
+                for (func, col), state in zip(aggregations, states)
+            }
+            for key in self._group_keys[group]:
                 results[key[0]] = key[1]
             result_set.append(results)
 
@@ -221,10 +292,9 @@ class GroupBy:
         """
         Return the set of groups - this is similar to a DISTINCT function
         """
-        collector = defaultdict(dict)
-        for record in self._map("*"):
-            collector[record[0]] = 1
+        # the groups are found as a side effect of mapping, so just drain it
+        deque(self._map(), maxlen=0)
 
         from orso.dataframe import DataFrame
 
-        return DataFrame(dict(self._group_keys[group]) for group in self._group_keys)
+        return DataFrame(dict(group) for group in self._group_keys)
@@ -6,8 +6,10 @@ import atexit
 import datetime
 import logging
 import os
+import sys
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Union
 
@@ -17,7 +19,11 @@ from orso.logging.levels import LEVELS
 from orso.logging.levels import LEVELS_TO_STRING
 from orso.logging.log_formatter import LogFormatter
 
-logging_seen_warnings: Dict[int, int] = {}
+# the number of times each warning has been suppressed and the warning itself
+logging_seen_warnings: Dict[int, List[Union[int, str]]] = {}
+
+# Cloud Run sets K_SERVICE, the environment is only read once
+IS_GCP: bool = bool(os.environ.get("K_SERVICE"))
 
 
 def fix_fields(obj: Any) -> Any:
@@ -34,14 +40,19 @@ def fix_dict(obj: dict) -> dict:
     return {k: fix_fields(v) for k, v in obj.items()}
 
 
-def report_suppressions(message):
+def report_suppressions():
     from .. import logging as ml
 
-    record = logging_seen_warnings.get(hash(message))
-    if record:
-        ml.get_logger().warning(
-            f'The following message was suppressed {record} time(s) - "{message}"'
-        )
+    # reporting goes through write_event, which can add to the dict we're reading
+    for suppressed, message in list(logging_seen_warnings.values()):
+        if suppressed:
+            ml.get_logger().warning(
+                f'The following message was suppressed {suppressed} time(s) - "{message}"'
+            )
+
+
+# registered once, rather than once for every distinct warning
+atexit.register(report_suppressions)
 
 
 def log_it(payload):
@@ -54,21 +65,20 @@ def log_it(payload):
 
 
 def extract_caller():
-    import os.path
-    import traceback
-
-    frames = traceback.extract_stack()
-    if len(frames) < 4:
+    # step straight to the caller's frame, three up from here, rather than summarizing
+    # the whole stack
+    try:
+        frame = sys._getframe(3)
+    except ValueError:
         return "<unknown>", "<unknown>", -1
-    frame = frames[len(frames) - 4]
-    head, tail = os.path.split(frame.filename)
-    return frame.name, tail, frame.lineno
+    head, tail = os.path.split(frame.f_code.co_filename)
+    return frame.f_code.co_name, tail, frame.f_lineno
 
 
 class GoogleLogger(object):
     @staticmethod
     def supported():
-        return os.environ.get("K_SERVICE", "") or "" != ""  # nosemgrep
+        return IS_GCP
 
     @staticmethod
     def write_event(
@@ -79,12 +89,13 @@ class GoogleLogger(object):
     ):
         # supress duplicate warnings
         if severity == LEVELS.WARNING:  # warnings
-            hashed = hash(str(message))
-            if hashed in logging_seen_warnings:
-                logging_seen_warnings[hashed] += 1
+            message_string = str(message)
+            hashed = hash(message_string)
+            seen = logging_seen_warnings.get(hashed)
+            if seen is not None:
+                seen[0] += 1
                 return "suppressed"
-            logging_seen_warnings[hashed] = 0
-            atexit.register(report_suppressions, str(message))
+            logging_seen_warnings[hashed] = [0, message_string]
 
         structured_log = {
             "severity": str(severity).split(".")[-1],
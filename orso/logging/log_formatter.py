@@ -1,8 +1,10 @@
+import copy
 import hashlib
 import json
 import logging
 import os
 import re
+from functools import lru_cache
 from typing import Dict
 
 from orso.display import colorizer
@@ -16,9 +18,20 @@ KEYS_TO_SANITIZE = [
     r"_token$",
     r"credentials",
 ]
-COMPILED_KEYS_TO_SANITIZE = [
-    re.compile(expression, re.IGNORECASE) for expression in KEYS_TO_SANITIZE
-]
+# a single alternation, so each key is matched in one pass rather than once per pattern
+KEYS_TO_SANITIZE_RE = re.compile(
+    "|".join(f"(?:{expression})" for expression in KEYS_TO_SANITIZE), re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1024)
+def is_sensitive_key(key: str) -> bool:
+    """
+    Is the key one of the keys we redact, log records tend to reuse the same keys so
+    the answer for each key is cached.
+    """
+    return KEYS_TO_SANITIZE_RE.match(key) is not None
+
 
 COLOR_EXCHANGES = {
     " ALERT    ": "\001BOLD_REDm ALERT    \001OFFm",
@@ -37,14 +50,28 @@ COLOR_CODES = {
     "VALUE": "\001VALUEm",
 }
 
+# the user and password in a URL, everything up to the first @ on the same line
+URL_CREDENTIALS_RE = re.compile(r"://[^@\n]*@")
 QUOTES_OR_BACKTICKS_RE = re.compile(r"(['`])(.*?)\1")
+# backticked, single quoted and double quoted text, found in one pass
+QUOTED_TEXT_RE = re.compile(r"`([^`]*)`|'([^']*)'|\"([^\"]*)\"")
+
+
+def highlight_quoted(match):
+    backticked, single_quoted, double_quoted = match.groups()
+    if backticked is not None:
+        return f"`\001YELLOWm{backticked}\001OFFm`"
+    if single_quoted is not None:
+        return f"'\001YELLOWm{single_quoted}\001OFFm'"
+    # double quotes are shown as single quotes
+    return f"'\001YELLOWm{double_quoted}\001OFFm'"
 
 
 class LogFormatter(logging.Formatter):
     def __init__(self, orig_formatter, suppress_color: bool = False):
         """
         Remove sensitive data from records before saving to external logs. Note that
-        the value is hashed using (SHA256) and only the first 8 characters of the
+        the value is hashed using (BLAKE2b) and only the 8 characters of the
         hex-encoded hash are presented. This information allows values to be traced
         without disclosing the actual value.
 
@@ -56,6 +83,20 @@ class LogFormatter(logging.Formatter):
         """
         self.orig_formatter = orig_formatter
         self.suppress_color = suppress_color
+        # the environment is read once rather than for every record
+        self._colorize = self._can_colorize()
+
+        # the color markers in the format and date templates are the same for every
+        # record, so expand (or strip) them once here rather than in every line, this
+        # is done on a copy so the caller's formatter is left as it was
+        style = getattr(orig_formatter, "_style", None)
+        if style is not None:
+            self.orig_formatter = orig_formatter = copy.copy(orig_formatter)
+            orig_formatter._style = copy.copy(style)
+            orig_formatter._style._fmt = colorizer(style._fmt, self._colorize)
+            orig_formatter._fmt = orig_formatter._style._fmt
+            if orig_formatter.datefmt:
+                orig_formatter.datefmt = colorizer(orig_formatter.datefmt, self._colorize)
 
     def format(self, record):
         try:
@@ -63,8 +104,8 @@ class LogFormatter(logging.Formatter):
         except:
             msg = record
         msg = self.sanitize_record(msg)
-        if "://" in msg:
-            msg = re.sub(r":\/\/(.*?)\@", r"://\001BOLD_PURLEm<redacted>\001OFFm", msg)
+        if "://" in msg and "@" in msg:
+            msg = URL_CREDENTIALS_RE.sub("://\001BOLD_PURLEm<redacted>\001OFFm", msg)
         return msg
 
     def _can_colorize(self) -> bool:
@@ -82,7 +123,7 @@ class LogFormatter(logging.Formatter):
         return "yes" in colorterm or "true" in colorterm or "256" in term
 
     def color_code(self, record):
-        if self._can_colorize():
+        if self._colorize:
             for k, v in COLOR_EXCHANGES.items():
                 if k in record:
                     return record.replace(k, v)
@@ -93,7 +134,8 @@ class LogFormatter(logging.Formatter):
 
     def hash_it(self, value_to_hash: str) -> str:
         """
-        Hash a value using SHA256.
+        Hash a value using BLAKE2b, only a 4 byte digest is made as only 8 hex
+        characters are shown.
 
         Parameters:
             value_to_hash: str
@@ -102,7 +144,7 @@ class LogFormatter(logging.Formatter):
         Returns:
             str: The hashed value.
         """
-        return hashlib.sha256(value_to_hash.encode()).hexdigest()[:8]
+        return hashlib.blake2b(value_to_hash.encode(), digest_size=4).hexdigest()
 
     def clean_record(self, dirty_record: Dict, colorize: bool = True) -> Dict:
         """
@@ -126,7 +168,7 @@ class LogFormatter(logging.Formatter):
         for key, value in dirty_record.items():
             if isinstance(value, dict):
                 value = self.clean_record(value, colorize)
-            elif any(regex.match(key) for regex in COMPILED_KEYS_TO_SANITIZE):
+            elif is_sensitive_key(key):
                 value = f"{colors['PURPLE']}<redacted:{self.hash_it(str(value))}>{colors['OFF']}"
             else:
                 value = QUOTES_OR_BACKTICKS_RE.sub(color_value, str(value))
@@ -157,10 +199,8 @@ class LogFormatter(logging.Formatter):
             parts.append(" " + json.dumps(clean_record))
 
         except ValueError:
-            json_part = re.sub(r"`([^`]*)`", r"`\001YELLOWm\1\001OFFm`", f"{json_part}")
-            json_part = re.sub(r"'([^']*)'", r"'\001YELLOWm\1\001OFFm'", f"{json_part}")
-            json_part = re.sub(r'"([^"]*)"', r"'\001YELLOWm\1\001OFFm'", f"{json_part}")
+            json_part = QUOTED_TEXT_RE.sub(highlight_quoted, json_part)
             parts.append(" " + json_part.strip() + " *")
 
         record = "|".join(parts)
-        return colorizer(record, self._can_colorize())
+        return colorizer(record, self._colorize)
@@ -96,14 +96,14 @@ class Distogram:  # pragma: no cover
         bin_values, counts = numpy.unique(values, return_counts=True)
         if len(bin_values) > (self._bin_count * 5):
             counts, bin_values = numpy.histogram(values, self._bin_count * 5, density=False)
-            bin_values = [bin_values[i] + bin_values[i + 1] / 2 for i in range(len(bin_values) - 1)]
-        for index, count in enumerate(counts):
-            if count > 0:
-                update(
-                    self,
-                    value=bin_values[index],
-                    count=count,
-                )
+            bin_values = bin_values[:-1] + bin_values[1:] / 2
+        # only the bins with values in them are added
+        for index in numpy.flatnonzero(counts):
+            update(
+                self,
+                value=bin_values[index],
+                count=counts[index],
+            )
 
         # we need to overwrite any range values as we've approximated the dataset
         if self.min is None:
@@ -1,8 +1,12 @@
-import heapq
+import operator
+from collections import Counter
 from copy import deepcopy
 from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import fields
+from dataclasses import replace
+from itertools import islice
 from typing import Any
 from typing import Dict
 from typing import List
@@ -60,16 +64,15 @@ def find_mfvs(data, top_n=MOST_FREQUENT_VALUE_SIZE):
     Find the top N most frequent values (MFVs) in a NumPy array along with their counts.
 
     Parameters:
-        data (np.ndarray): The input NumPy array containing numerical data.
+        data (np.ndarray): The input NumPy array containing numerical data, or a Counter
+            of the values if they have already been counted.
         top_n (int): The number of top MFVs to return. Default is 32.
 
     Returns:
         top_values (np.ndarray): The top N most frequent values in the data.
         top_counts (np.ndarray): The counts of the top N most frequent values.
     """
-    from collections import Counter
-
-    counter = Counter(data)
+    counter = data if isinstance(data, Counter) else Counter(data)
 
     # Most common returns tuples of (value, count), so separate them
     top_items = counter.most_common(top_n)
@@ -79,38 +82,52 @@ def find_mfvs(data, top_n=MOST_FREQUENT_VALUE_SIZE):
 
 
 def get_kvm_hashes(data, size: int):  # slowest function
-    min_hashes = []
-
-    data = list(set(data))
-
-    # Build a list with the hash values of the first 'size' elements or all elements if fewer.
-    min_hashes = [-CityHash32(str(element)) for element in data[:size]]
-
-    # Transform the list into a heap in-place.
-    heapq.heapify(min_hashes)
-
-    for element in data[size:]:
-        hash_value = CityHash32(str(element))
-
-        # If the current hash is smaller than the largest in the heap
-        if hash_value < -min_hashes[0]:
-            heapq.heappushpop(min_hashes, -hash_value)
-
-    # Convert back to positive values and sort before returning
-    return sorted(-x for x in min_hashes)
+    if size <= 0:
+        return []
+    if isinstance(data, numpy.ndarray) and data.dtype.kind != "O":
+        # numbers are hashed from their raw bytes, viewing each value as a fixed-width
+        # block of bytes means they can be hashed without formatting them as strings
+        data = numpy.unique(data)
+        hashes = map(CityHash32, data.view(f"V{data.itemsize}").tolist())
+    else:
+        hashes = (CityHash32(str(element)) for element in set(data))
+    hashes = numpy.fromiter(hashes, dtype=numpy.int64)
+
+    # partitioning moves the 'size' smallest hashes to the front, in any order, without
+    # sorting everything, only these few then need sorting
+    if size < len(hashes):
+        hashes = numpy.partition(hashes, size - 1)[:size]
+    return numpy.sort(hashes).tolist()
 
 
 def get_ordered_and_transitions(data) -> tuple:
+    if isinstance(data, numpy.ndarray):
+        # compare each value to the one before it for the whole array at once
+        increases = int(numpy.count_nonzero(data[1:] > data[:-1]))
+        decreases = int(numpy.count_nonzero(data[1:] < data[:-1]))
+        if increases and decreases:
+            return (0, increases + decreases)
+        if increases:
+            return (1, increases)
+        if decreases:
+            return (-1, decreases)
+        return (None, 0)
+
     ordered = None
     transitions = 0
     last_value = data[0]
-    for value in data[1:]:
+    for position, value in enumerate(islice(data, 1, None), 1):
         if value != last_value:
             transitions += 1
             if ordered is None:
                 ordered = -1 if value < last_value else 1
             elif value > last_value and ordered == -1 or value < last_value and ordered == 1:
-                ordered = 0
+                # once the values have gone both up and down they can't be ordered, the
+                # remaining changes are counted without checking which way they go
+                transitions += sum(
+                    map(operator.ne, islice(data, position, None), islice(data, position + 1, None))
+                )
+                return (0, transitions)
         last_value = value
 
     return (ordered, transitions)
@@ -166,33 +183,32 @@ class ColumnProfile:
         return (self.count - self.missing) - distogram.count_at(self.distogram, point)
 
     def __add__(self, profile: "ColumnProfile") -> "ColumnProfile":
-        new_profile = self.deep_copy()
+        # the lists other than the hashes are always replaced below, so they don't
+        # need to be deep copied
+        new_profile = replace(self, kmv_hashes=self.kmv_hashes.copy())
         new_profile.count += profile.count
         new_profile.missing += profile.missing
         new_profile.transitions += profile.transitions + 1
         new_profile.order = 0 if new_profile.order == profile.order else new_profile.order
-        new_profile.minimum = min([self.minimum or INFINITY, profile.minimum or INFINITY])
+        new_profile.minimum = min(self.minimum or INFINITY, profile.minimum or INFINITY)
         if new_profile.minimum == INFINITY:
             new_profile.minimum = None
-        new_profile.maximum = max([self.maximum or -INFINITY, profile.maximum or -INFINITY])
+        new_profile.maximum = max(self.maximum or -INFINITY, profile.maximum or -INFINITY)
         if new_profile.maximum == -INFINITY:
             new_profile.maximum = None
 
         if self.most_frequent_values and profile.most_frequent_values:
-            morsel1_map = dict(zip(self.most_frequent_values, self.most_frequent_counts))
             morsel2_map = dict(zip(profile.most_frequent_values, profile.most_frequent_counts))
 
-            combined_map = {}
-            for value in morsel1_map:
-                if value in morsel2_map:  # Ensure the value is present in both morsels
-                    combined_map[value] = morsel1_map[value] + morsel2_map[value]
+            # Ensure the value is present in both morsels
+            combined_map = {
+                value: count + morsel2_map[value]
+                for value, count in zip(self.most_frequent_values, self.most_frequent_counts)
+                if value in morsel2_map
+            }
 
-            new_profile.most_frequent_values = (
-                [] if len(combined_map) == 0 else list(combined_map.keys())
-            )
-            new_profile.most_frequent_counts = (
-                [] if len(combined_map) == 0 else list(combined_map.values())
-            )
+            new_profile.most_frequent_values = list(combined_map)
+            new_profile.most_frequent_counts = list(combined_map.values())
         else:
             new_profile.most_frequent_values = []
             new_profile.most_frequent_counts = []
@@ -208,7 +224,8 @@ class ColumnProfile:
             new_profile.histogram = []
 
         if self.kmv_hashes and profile.kmv_hashes:
-            new_profile.kmv_hashes = sorted(set(self.kmv_hashes + profile.kmv_hashes))[:KVM_SIZE]
+            merged_hashes = set(self.kmv_hashes).union(profile.kmv_hashes)
+            new_profile.kmv_hashes = sorted(merged_hashes)[:KVM_SIZE]
 
         return new_profile
 
@@ -217,12 +234,13 @@ class TableProfile:
     def __init__(self):
         self._columns: List[ColumnProfile] = []
         self._column_names: List[str] = []
+        # the position of each column by name, so finding a column doesn't scan them all
+        self._column_positions: Dict[str, int] = {}
 
     def __add__(self, right_profile: "TableProfile") -> "TableProfile":
         new_profile = TableProfile()
 
-        for column_name in self._column_names:
-            left_column = self.column(column_name)
+        for column_name, left_column in zip(self._column_names, self._columns):
             right_column = right_profile.column(column_name)
             if not right_column:
                 right_column = ColumnProfile(
@@ -235,6 +253,7 @@ class TableProfile:
     def add_column(self, profile: ColumnProfile, name: str):
         self._columns.append(profile)
         self._column_names.append(name)
+        self._column_positions.setdefault(name, len(self._columns) - 1)
 
     def __iter__(self):
         """An iterator over columns"""
@@ -243,10 +262,8 @@ class TableProfile:
     def column(self, i: Union[int, str]) -> Union[ColumnProfile, None]:
         """Get a column by its name or index"""
         if isinstance(i, str):
-            for name, column in zip(self._column_names, self._columns):
-                if name == i:
-                    return column
-            return None
+            position = self._column_positions.get(i)
+            return None if position is None else self._columns[position]
 
         if isinstance(i, int):
             return self._columns[i]
@@ -262,7 +279,13 @@ class TableProfile:
     def to_dataframe(self) -> "DataFrame":
         import orso
 
-        return orso.DataFrame(self.to_dicts())
+        # each profile's fields are read in the order they're declared rather than through
+        # asdict, the values are still copied so the frame doesn't share the profile's lists
+        names = [profile_field.name for profile_field in fields(ColumnProfile)]
+        get_values = operator.attrgetter(*names)
+        return orso.DataFrame(
+            [dict(zip(names, deepcopy(get_values(column)))) for column in self._columns]
+        )
 
     @classmethod
     def from_dataframe(cls, table) -> "TableProfile":
@@ -271,41 +294,39 @@ class TableProfile:
 
         profile = cls()
 
-        profiler_classes = {
-            OrsoTypes.VARCHAR: VarcharProfiler,
-            OrsoTypes.INTEGER: NumericProfiler,
-            OrsoTypes.DOUBLE: NumericProfiler,
-            OrsoTypes.DECIMAL: NumericProfiler,
-            OrsoTypes.ARRAY: ListStructProfiler,
-            OrsoTypes.STRUCT: ListStructProfiler,
-            OrsoTypes.BOOLEAN: BooleanProfiler,
-            OrsoTypes.DATE: DateProfiler,
-            OrsoTypes.TIMESTAMP: DateProfiler,
-        }
-
-        profiles = {}
+        # every morsel has the table's schema, so the columns and their types are worked
+        # out once here rather than for each morsel
+        schema = table.schema
+        if not isinstance(schema, RelationSchema):
+            schema = RelationSchema(name="morsel", columns=[FlatColumn(name=c) for c in schema])
+        columns = schema.columns
+        column_positions = list(range(len(columns)))
+
+        # the running profile of each column, and the profiler for the column's type,
+        # by the column's position
+        profiles: List[Optional[ColumnProfile]] = [None] * len(columns)
+        profiler_classes = [
+            PROFILER_CLASSES.get(column.type, DefaultProfiler) for column in columns
+        ]
 
         for morsel in table.to_batches(25000):
-            if not isinstance(morsel.schema, RelationSchema):
-                morsel._schema = RelationSchema(
-                    name="morsel", columns=[FlatColumn(name=c) for c in morsel.schema]
-                )
-
-            for column in morsel.schema.columns:
-                column_data = morsel.collect(column.name)
+            # the columns are collected together in one pass over the rows, rather than
+            # a pass, and a search for the column by name, for each column
+            collected = morsel.collect(column_positions)
+            for position, (column, column_data) in enumerate(zip(columns, collected)):
                 if len(column_data) == 0:
                     continue
 
-                profiler_class = profiler_classes.get(column.type, DefaultProfiler)
-                profiler = profiler_class(column)
+                profiler = profiler_classes[position](column)
                 profiler(column_data=column_data)
-                if column.name in profiles:
-                    profiles[column.name] += profiler.profile
+                if profiles[position] is None:
+                    profiles[position] = profiler.profile
                 else:
-                    profiles[column.name] = profiler.profile
+                    profiles[position] += profiler.profile
 
-        for name, summary in profiles.items():
-            profile.add_column(summary, name)
+        for summary in profiles:
+            if summary is not None:
+                profile.add_column(summary, summary.name)
 
         return profile
 
@@ -335,32 +356,49 @@ class BooleanProfiler(BaseProfiler):
     def __call__(self, column_data: List[Any]):
         self.profile.count = len(column_data)
 
-        column_data = [col for col in column_data if col is not None]
-        self.profile.missing = self.profile.count - len(column_data)
+        # count each value in place rather than copying the column without its nulls
+        trues = column_data.count(True)
+        falses = column_data.count(False)
+        self.profile.missing = self.profile.count - trues - falses
 
-        if len(column_data) > 0:
+        if trues or falses:
             self.profile.most_frequent_values = ["True", "False"]
-            self.profile.most_frequent_counts = [column_data.count(True), column_data.count(False)]
+            self.profile.most_frequent_counts = [trues, falses]
 
 
 class NumericProfiler(BaseProfiler):
     def __call__(self, column_data: List[Any]):
         self.profile.count = len(column_data)
-        column_data = numpy.array(column_data, copy=False)  # Ensure column_data is a NumPy array
-        if column_data.dtype.name == "object":
-            column_data = column_data[~numpy.equal(column_data, -9223372036854775808)]
-            column_data = [float(c) for c in column_data if c is not None]
+        if self.column.type != OrsoTypes.DECIMAL:
+            # numpy is very slow working out the type of a list of Decimals, we already
+            # know they're objects so don't ask it to
+            column_data = numpy.array(column_data, copy=False)
+        if not isinstance(column_data, numpy.ndarray) or column_data.dtype.name == "object":
+            # the nulls are dropped and the rest converted to floats in a single pass
+            column_data = numpy.fromiter(
+                (value for value in column_data if value is not None), dtype=numpy.float64
+            )
+            column_data = column_data[column_data != -9223372036854775808]
         else:
             column_data = column_data[~numpy.isnan(column_data)]
         self.profile.missing = self.profile.count - len(column_data)
         # Compute min and max only if necessary
         if len(column_data) > 0:
-            self.profile.minimum = int(numpy.min(column_data))
-            self.profile.maximum = int(numpy.max(column_data))
+            # a single sort gives the distinct values, in order, and how often each
+            # appears, the range, the most frequent values and the hashes come from these
+            # rather than each making its own pass over the data
+            uniques, first_seen, counts = numpy.unique(
+                column_data, return_index=True, return_counts=True
+            )
+            self.profile.minimum = int(uniques[0])
+            self.profile.maximum = int(uniques[-1])
 
-            mf_values, mf_counts = find_mfvs(column_data, MOST_FREQUENT_VALUE_SIZE)
-            self.profile.most_frequent_values = [f"{n:f}".rstrip("0").strip(".") for n in mf_values]
-            self.profile.most_frequent_counts = mf_counts
+            # most frequent first, ties in the order they first appear
+            top = numpy.lexsort((first_seen, -counts))[:MOST_FREQUENT_VALUE_SIZE]
+            self.profile.most_frequent_values = [
+                f"{n:f}".rstrip("0").strip(".") for n in uniques[top].tolist()
+            ]
+            self.profile.most_frequent_counts = counts[top].tolist()
 
             # Create a histogram of the data
             hist_counts, bin_edges = numpy.histogram(column_data, bins=DISTOGRAM_BIN_COUNT)
@@ -371,7 +409,7 @@ class NumericProfiler(BaseProfiler):
             ]
 
             # K-minimum value hashes, used for cardinality estimation
-            self.profile.kmv_hashes = get_kvm_hashes(column_data, KVM_SIZE)
+            self.profile.kmv_hashes = get_kvm_hashes(uniques, KVM_SIZE)
             self.profile.order, self.profile.transitions = get_ordered_and_transitions(column_data)
 
 
@@ -382,12 +420,19 @@ class VarcharProfiler(BaseProfiler):
         if len(column_data) > 0:
             # K-minimum value hashes, used for cardinality estimation
             self.profile.kmv_hashes = get_kvm_hashes(column_data, KVM_SIZE)
-            column_data = [col[:SIXTY_FOUR_BYTES] for col in column_data]
+            # most strings are shorter than this, checking the length is cheaper than slicing
+            column_data = [
+                col if len(col) <= SIXTY_FOUR_BYTES else col[:SIXTY_FOUR_BYTES]
+                for col in column_data
+            ]
             self.profile.missing = self.profile.count - len(column_data)
-            self.profile.minimum = string_to_int64(min(column_data))
-            self.profile.maximum = string_to_int64(max(column_data))
+            # the counts are needed for the most frequent values anyway, and the range
+            # is quicker to find from the distinct values they're keyed by
+            value_counts = Counter(column_data)
+            self.profile.minimum = string_to_int64(min(value_counts))
+            self.profile.maximum = string_to_int64(max(value_counts))
 
-            mf_values, mf_counts = find_mfvs(column_data, MOST_FREQUENT_VALUE_SIZE)
+            mf_values, mf_counts = find_mfvs(value_counts, MOST_FREQUENT_VALUE_SIZE)
             self.profile.most_frequent_values = mf_values
             self.profile.most_frequent_counts = mf_counts
             self.profile.order, self.profile.transitions = get_ordered_and_transitions(column_data)
@@ -401,7 +446,11 @@ class DateProfiler(BaseProfiler):
                 [v.value for v in column_data if v is not None], dtype="int64"
             )
         else:
-            column_data = numpy.array(column_data, dtype="datetime64[s]").astype("int64")
+            # fromiter converts straight into the typed array, building the array from a
+            # list first is about twice as slow
+            column_data = numpy.fromiter(
+                column_data, dtype="datetime64[s]", count=len(column_data)
+            ).astype("int64")
         column_data = column_data[~numpy.equal(column_data, -9223372036854775808)]
         self.profile.missing = self.profile.count - len(column_data)
         if len(column_data) > 0:
@@ -417,5 +466,18 @@ class DateProfiler(BaseProfiler):
             self.profile.kmv_hashes = numeric_profile.kmv_hashes
 
 
+PROFILER_CLASSES = {
+    OrsoTypes.VARCHAR: VarcharProfiler,
+    OrsoTypes.INTEGER: NumericProfiler,
+    OrsoTypes.DOUBLE: NumericProfiler,
+    OrsoTypes.DECIMAL: NumericProfiler,
+    OrsoTypes.ARRAY: ListStructProfiler,
+    OrsoTypes.STRUCT: ListStructProfiler,
+    OrsoTypes.BOOLEAN: BooleanProfiler,
+    OrsoTypes.DATE: DateProfiler,
+    OrsoTypes.TIMESTAMP: DateProfiler,
+}
+
+
 def table_profiler(dataframe) -> List[Dict[str, Any]]:
     return TableProfile.from_dataframe(dataframe)
@@ -59,6 +59,7 @@ from dataclasses import field
 from dataclasses import fields
 from decimal import getcontext
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -87,6 +88,12 @@ _MISSING_VALUE: str = str()
 DECIMAL_PRECISION: int = getcontext().prec
 
 
+@lru_cache(maxsize=16)
+def _fields_by_name(column_class: type) -> Dict[str, Any]:
+    # a class's fields don't change, so they're only read once per column class
+    return {f.name: f for f in fields(column_class)}
+
+
 class ColumnDisposition(Enum):
     NAME = "name"
     AGE = "age"
@@ -145,7 +152,7 @@ class FlatColumn:
     origin: Optional[List[str]] = field(default_factory=list)
 
     def __init__(self, **kwargs):
-        attributes = {f.name: f for f in fields(self.__class__)}
+        attributes = _fields_by_name(self.__class__)
         for attribute in attributes:
             if attribute in kwargs:
                 value = kwargs[attribute]
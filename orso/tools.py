@@ -19,6 +19,7 @@ import threading
 import time
 import uuid
 from collections import OrderedDict
+from functools import lru_cache
 from functools import wraps
 from random import getrandbits
 from typing import Any
@@ -570,27 +571,15 @@ class DecimalFactory(decimal.Decimal):
         return factory
 
 
-def arrow_type_map(parquet_type) -> Union[Type, None]:
+@lru_cache(maxsize=1)
+def _arrow_type_id_map() -> dict:
     """
-    Maps PyArrow types to corresponding Python types.
-
-    Parameters:
-        parquet_type: lib.DataType
-            PyArrow DataType object.
-
-    Returns:
-        Type or None: Corresponding Python type for the PyArrow DataType or None if not recognized.
-
-    Raises:
-        ValueError: If the PyArrow DataType is not recognized.
+    Build the PyArrow type id to Python type lookup once, rather than for every
+    field we map.
     """
+    import pyarrow.lib as lib
 
-    try:
-        import pyarrow.lib as lib
-    except ImportError as import_error:
-        raise MissingDependencyError(import_error.name) from import_error
-
-    type_map = {
+    return {
         lib.Type_NA: None,
         lib.Type_BOOL: bool,
         lib.Type_INT8: int,
@@ -621,6 +610,29 @@ def arrow_type_map(parquet_type) -> Union[Type, None]:
         lib.Type_LARGE_BINARY: bytes,
     }
 
+
+def arrow_type_map(parquet_type) -> Union[Type, None]:
+    """
+    Maps PyArrow types to corresponding Python types.
+
+    Parameters:
+        parquet_type: lib.DataType
+            PyArrow DataType object.
+
+    Returns:
+        Type or None: Corresponding Python type for the PyArrow DataType or None if not recognized.
+
+    Raises:
+        ValueError: If the PyArrow DataType is not recognized.
+    """
+
+    try:
+        import pyarrow.lib as lib
+    except ImportError as import_error:
+        raise MissingDependencyError(import_error.name) from import_error
+
+    type_map = _arrow_type_id_map()
+
     if parquet_type.id in type_map:
         return type_map[parquet_type.id]
     elif parquet_type.id in {lib.Type_DECIMAL128, lib.Type_DECIMAL256}:
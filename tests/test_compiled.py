@@ -14,7 +14,14 @@ def test_collector():
     assert sum(columns[0]) == 11
     assert sum(columns[1]) == 10
 
+
+def test_collector_non_tuple_rows():
+
+    columns = collect_cython([[1, 2], (2, 1), [7, 8]], numpy.array([-1, 0], dtype=numpy.int32), 2)
+    assert columns == [[2, 1], [1, 2]], columns
+
 if __name__ == "__main__":  # prgama: nocover
     from tests import run_tests
     test_collector()
+    test_collector_non_tuple_rows()
     run_tests()
@@ -82,6 +82,31 @@ def test_dataframe_slice():
     assert len(result) == 2
 
 
+def test_dataframe_select():
+    dataframe = create_dataframe()
+
+    single = dataframe.select("B")
+    assert single.column_names == ("B",)
+    assert single.collect("B") == ["a", "b", "c", None, "e"]
+
+    pair = dataframe.select(["A", "C"])
+    assert pair.collect(["A", "C"]) == [[1, 2, 3, 4, 5], [1.1, 2.2, 3.3, 4.4, 5.5]]
+
+    everything = dataframe.select(["A", "B", "C"])
+    assert everything.shape == (5, 3)
+    assert everything.collect([0, 1, 2]) == dataframe.collect([0, 1, 2])
+
+
+def test_dataframe_query():
+    dataframe = create_dataframe()
+
+    result = dataframe.query(lambda row: row[0] % 2 == 1)
+    assert result.collect("A") == [1, 3, 5], result.collect("A")
+
+    result = dataframe.query(lambda row: row[1] is None)
+    assert result.rowcount == 1
+
+
 def test_dataframe_iter():
     dataframe = create_dataframe()
     assert len(list(dataframe)) == 5
@@ -98,6 +123,34 @@ def test_dataframe_user_init():
     assert df.rowcount == 20, df
 
 
+def test_dataframe_init_from_generator():
+    df = DataFrame(d for d in cities.values)
+    assert df.rowcount == 20, df.rowcount
+
+    df = DataFrame(iter([]))
+    assert df.shape == (0, 0), df.shape
+
+
+def test_dataframe_init_from_mixed_mappings():
+    from collections import OrderedDict
+    from collections import defaultdict
+    from types import MappingProxyType
+
+    df = DataFrame(
+        [
+            {"a": 1, "b": "one"},
+            MappingProxyType({"a": 2, "b": "two"}),
+            OrderedDict(a=3, b="three"),
+            defaultdict(str, {"b": "four", "a": 4}),
+            {"a": 5},
+        ]
+    )
+    assert df.collect(["a", "b"]) == [[1, 2, 3, 4, 5], ["one", "two", "three", "four", None]]
+
+    df = DataFrame([OrderedDict(a=1, b=2), {"a": 3}])
+    assert df.collect(["a", "b"]) == [[1, 3], [2, None]], df.collect(["a", "b"])
+
+
 def test_dataframe_head():
     df = DataFrame(cities.values)
 
@@ -62,6 +62,39 @@ def test_display_ascii_greedy():
         assert len(find_all_substrings(ascii, "Tokyo")) == (1 if i != 0 else 0)
 
 
+def test_display_ascii_typed_columns():
+    import decimal
+    from orso.schema import FlatColumn, RelationSchema
+    from orso.types import OrsoTypes
+
+    schema = RelationSchema(
+        name="typed",
+        columns=[
+            FlatColumn(name="a", type=OrsoTypes.INTEGER),
+            FlatColumn(name="b", type=OrsoTypes.BOOLEAN),
+            FlatColumn(name="c", type=OrsoTypes.DECIMAL),
+        ],
+    )
+    # the second and third rows don't match the declared types
+    rows = [(1, True, decimal.Decimal("1.5")), (None, None, None), (True, 1, 2.5)]
+    df = DataFrame(rows=rows, schema=schema)
+
+    ascii = df.display(colorize=False, show_types=False).split("\n")
+
+    assert ascii[3] == "│ 1 │    1 │ True │  1.5 │", ascii[3]
+    assert ascii[4] == "│ 2 │ null │ null │ null │", ascii[4]
+    assert ascii[5] == "│ 3 │ True │    1 │  2.5 │", ascii[5]
+
+
+def test_character_width():
+    from orso.display import character_width
+
+    assert character_width("a") == 1
+    assert character_width("é") == 1
+    assert character_width("א") == 1  # neutral
+    assert character_width("東") == 2  # wide
+    assert character_width("Ａ") == 2  # fullwidth
+
 
 if __name__ == "__main__":  # prgama: nocover
     from tests import run_tests
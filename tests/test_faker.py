@@ -1,4 +1,5 @@
 import os
+import random
 import sys
 import pytest
 
@@ -37,6 +38,28 @@ def test_generate_fake_data():
                 assert isinstance(row[index], str) or row[index] is None
 
 
+def test_generate_fake_data_is_repeatable():
+    columns = [
+        FlatColumn(name="ID", type=OrsoTypes.INTEGER),
+        FlatColumn(name="Name", type=OrsoTypes.VARCHAR, disposition=ColumnDisposition.NAME),
+        FlatColumn(name="Code", type=OrsoTypes.VARCHAR),
+        FlatColumn(name="Flag", type=OrsoTypes.BOOLEAN),
+        FlatColumn(name="Price", type=OrsoTypes.DECIMAL, precision=8, scale=2),
+        FlatColumn(name="Score", type=OrsoTypes.DOUBLE),
+        FlatColumn(name="Seen", type=OrsoTypes.TIMESTAMP),
+    ]
+    schema = RelationSchema(name="TestSchema", columns=columns)
+
+    random.seed(42)
+    first = list(generate_fake_data(schema, size=200))
+    random.seed(42)
+    second = list(generate_fake_data(schema, size=200))
+    third = list(generate_fake_data(schema, size=200))
+
+    assert first == second
+    assert first != third
+
+
 def test_generate_random_row():
     # Create a simple schema for the test
     columns = [
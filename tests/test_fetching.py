@@ -57,6 +57,16 @@ def test_fetchmany():
     assert result3 == expected3, result3
 
 
+def test_fetchmany_from_generator():
+    def _rows():
+        yield from [(1, "John"), (2, "Jane"), (3, "Bob")]
+        raise AssertionError("fetchmany read past the requested rows")
+
+    dataframe = DataFrame(rows=_rows(), schema=["id", "name"])
+    result = dataframe.fetchmany(3)
+    assert result == [(1, "John"), (2, "Jane"), (3, "Bob")], result
+
+
 def test_fetch_methods():
     dataframe = DataFrame(
         rows=[(1, "John"), (2, "Jane"), (3, "Bob")],
@@ -83,6 +83,40 @@ def test_group_by_groups_language():
     assert len(result) == 17
 
 
+def test_group_by_multiple_columns():
+    df = DataFrame(values)
+    result = df.group_by(["country", "language"]).count()
+
+    assert len(result) == 20
+
+    for row in result:
+        row_dict = row.as_dict
+        if row_dict["country"] == "United States":
+            assert row_dict["language"] == "English"
+            assert row_dict["COUNT(*)"] == 1
+
+
+def test_group_by_generator():
+    df = DataFrame(rows=(row for row in DataFrame(values)._rows), schema=schema)
+    result = df.group_by("language").count()
+
+    assert len(result) == 17
+
+
+def test_group_by_several_aggregations_on_one_column():
+    df = DataFrame(values)
+    result = df.group_by("language").aggregate(
+        [("SUM", "population"), ("COUNT", "population"), ("MAX", "population")]
+    )
+
+    for row in result:
+        row_dict = row.as_dict
+        if row_dict["language"] == "English":
+            assert row_dict["SUM(population)"] == 37606863, row_dict
+            assert row_dict["COUNT(population)"] == 4, row_dict
+            assert row_dict["MAX(population)"] == 14913700, row_dict
+
+
 if __name__ == "__main__":  # prgama: nocover
     from tests import run_tests
 
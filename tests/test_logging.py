@@ -19,6 +19,72 @@ def test_google_logger():
     logger.write_event("Google", "Test")
 
 
+def test_clean_record_redacts_sensitive_keys():
+    from orso.logging.log_formatter import LogFormatter
+
+    formatter = LogFormatter(None)
+    cleaned = formatter.clean_record(
+        {"password": "hunter2", "api_key": "abc", "name": "Ada", "nested": {"pwd": "x"}},
+        colorize=False,
+    )
+
+    assert cleaned["password"].startswith("<redacted:"), cleaned
+    assert cleaned["api_key"].startswith("<redacted:"), cleaned
+    assert cleaned["name"] == "Ada", cleaned
+    assert "hunter2" not in str(cleaned)
+    assert "'pwd': '<redacted:" in cleaned["nested"], cleaned
+
+
+def test_google_logger_reports_every_suppression():
+    import io
+    from contextlib import redirect_stdout
+
+    from orso.logging import google_cloud_logger
+    from orso.logging.create_logger import get_logger
+
+    seen = google_cloud_logger.logging_seen_warnings
+    saved = dict(seen)
+    google_cloud_logger.IS_GCP = True
+    get_logger.cache_clear()
+    try:
+        seen.clear()
+        seen[1] = [2, "first warning"]
+        seen[2] = [3, "second warning"]
+        seen[3] = [0, "never repeated"]
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            google_cloud_logger.report_suppressions()
+
+        reported = output.getvalue().splitlines()
+        assert len(reported) == 2, reported
+        assert "suppressed 2 time(s)" in reported[0] and "first warning" in reported[0], reported
+        assert "suppressed 3 time(s)" in reported[1] and "second warning" in reported[1], reported
+    finally:
+        google_cloud_logger.IS_GCP = False
+        get_logger.cache_clear()
+        seen.clear()
+        seen.update(saved)
+
+
+def test_log_formatter_leaves_wrapped_formatter_alone():
+    import logging as py_logging
+
+    from orso.logging.log_formatter import LogFormatter
+
+    fmt = "\001YELLOWm%(name)s\001OFFm | %(message)s"
+    datefmt = "\001DATEm%Y-%m-%d\001OFFm"
+    shared = py_logging.Formatter(fmt, datefmt=datefmt)
+
+    formatter = LogFormatter(shared, suppress_color=True)
+    record = py_logging.LogRecord("orso", py_logging.WARNING, __file__, 1, "hello", None, None)
+
+    assert formatter.format(record).startswith("orso | hello"), formatter.format(record)
+    assert shared._fmt == fmt
+    assert shared._style._fmt == fmt
+    assert shared.datefmt == datefmt
+
+
 if __name__ == "__main__":  # prgama: nocover
     from tests import run_tests
 
@@ -17,6 +17,85 @@ def test_can_profile():
     assert profile.collect("count") == [20] * 6
 
 
+def test_profile_to_dataframe_rows():
+    import orso
+    from orso.row import Row
+
+    df = orso.DataFrame(cities.values)
+    profile = df.profile
+    frame = profile.to_dataframe()
+
+    row = frame.fetchone()
+    assert isinstance(row, Row), type(row)
+    assert row.as_dict["name"] == "name", row.as_dict
+    assert row.as_dict["count"] == 20, row.as_dict
+    assert frame.nbytes() > 0
+
+    # the frame holds copies, changing it doesn't change the profile
+    row.as_dict["most_frequent_values"].append("changed")
+    frame.collect("histogram")[0].append("changed")
+    assert "changed" not in profile.column("name").most_frequent_values
+    assert "changed" not in profile.column("name").histogram
+
+
+def test_add_profiles():
+    import orso
+
+    df = orso.DataFrame(cities.values)
+    profile = df.profile + df.profile
+
+    assert profile.column("name").count == 40
+    assert profile.column("name").missing == 0
+    assert profile.column(0) is profile.column(df.column_names[0])
+    assert profile.column("not a column") is None
+
+
+def test_get_ordered_and_transitions():
+    import numpy
+
+    from orso.profiler.profiler import get_ordered_and_transitions
+
+    cases = [
+        ([1, 2, 2, 3, 7], (1, 3)),  # ascending
+        ([7, 3, 2, 2, 1], (-1, 3)),  # descending
+        ([1, 3, 2, 2, 5, 5, 1], (0, 4)),  # mixed, changes after the order is settled
+        ([4, 4, 4, 4], (None, 0)),  # constant
+        ([4], (None, 0)),
+    ]
+    letters = "abcdefgh"
+    for values, expected in cases:
+        strings = [letters[value] for value in values]
+        assert get_ordered_and_transitions(values) == expected, values
+        assert get_ordered_and_transitions(numpy.array(values)) == expected, values
+        assert get_ordered_and_transitions(strings) == expected, strings
+        assert get_ordered_and_transitions(numpy.array(strings)) == expected, strings
+
+
+def test_get_kvm_hashes():
+    import numpy
+    from cityhash import CityHash32
+
+    from orso.profiler.profiler import get_kvm_hashes
+
+    # fewer distinct values than the size, every hash is kept, duplicates only once
+    words = ["apple", "banana", "cherry", "banana", "apple"]
+    expected = sorted(CityHash32(str(word)) for word in set(words))
+    assert get_kvm_hashes(words, 8) == expected
+
+    # more distinct values than the size, only the smallest hashes are kept
+    many = [f"value-{i}" for i in range(500)]
+    assert get_kvm_hashes(many, 16) == sorted(CityHash32(str(v)) for v in many)[:16]
+
+    # numbers in arrays are hashed from their bytes
+    floats = numpy.array([1.5, -2.25, 3.0, 1.5, 1e10, 0.0])
+    expected = sorted(CityHash32(value.tobytes()) for value in numpy.unique(floats))
+    assert get_kvm_hashes(floats, 8) == expected
+    assert get_kvm_hashes(floats, 2) == expected[:2]
+
+    assert get_kvm_hashes(words, 0) == []
+    assert get_kvm_hashes(floats, 0) == []
+
+
 def test_opteryx_profile_planets():
     try:
         sys.path.insert(1, os.path.join(sys.path[0], "../../opteryx"))